@@ -6,13 +6,10 @@ Hanzo Dev CLI - Unified development environment combining ACI and MCP capabiliti
 import argparse
 import asyncio
 import sys
-from typing import Optional
 from pathlib import Path
 
 # Import MCP components
 from hanzo_mcp.cli import main as mcp_main
-from hanzo_mcp.server import HanzoServer
-from hanzo_mcp.config import Settings
 
 # Import ACI components
 from hanzo_aci import file_editor, FileCache
@@ -116,7 +113,7 @@ async def run_editor(args):
         result = editor.open_file(args.file, line_number=args.line)
         print(result)
     except Exception as e:
-        logger.error(f"Error opening file: {e}")
+        logger.error("Error opening file: %s", e)
         return 1
     
     return 0
@@ -131,7 +128,7 @@ async def run_indexer(args):
         
         output_path = args.output or f"{Path(args.path).name}_index.json"
         
-        logger.info(f"Indexing {args.path}...")
+        logger.info("Indexing %s...", args.path)
         index_data = await index_codebase(args.path)
         
         # Save index
@@ -139,11 +136,11 @@ async def run_indexer(args):
         with open(output_path, 'w') as f:
             json.dump(index_data, f, indent=2)
         
-        logger.info(f"Index saved to {output_path}")
+        logger.info("Index saved to %s", output_path)
         return 0
         
     except Exception as e:
-        logger.error(f"Error indexing codebase: {e}")
+        logger.error("Error indexing codebase: %s", e)
         return 1
 
 
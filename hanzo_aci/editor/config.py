@@ -1,2 +1,4 @@
 MAX_RESPONSE_LEN_CHAR: int = 16000
+# Characters of `find` output read for a directory listing before it is sorted
+MAX_DIRECTORY_LISTING_CHAR: int = 16 * MAX_RESPONSE_LEN_CHAR
 SNIPPET_CONTEXT_WINDOW: int = 4
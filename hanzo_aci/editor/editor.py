@@ -1,16 +1,17 @@
+import codecs
+import functools
 import os
 import re
 import shutil
+import stat
 import tempfile
 from pathlib import Path
 from typing import Literal, get_args
 
-from binaryornot.check import is_binary
-
 from hanzo_aci.linter import DefaultLinter
 from hanzo_aci.utils.shell import run_shell_cmd
 
-from .config import SNIPPET_CONTEXT_WINDOW
+from .config import MAX_DIRECTORY_LISTING_CHAR, SNIPPET_CONTEXT_WINDOW
 from .encoding import EncodingManager, with_encoding
 from .exceptions import (
     EditorToolParameterInvalidError,
@@ -19,7 +20,6 @@ from .exceptions import (
     ToolError,
 )
 from .history import FileHistoryManager
-from .md_converter import MarkdownConverter  # type: ignore
 from .prompts import (
     BINARY_FILE_CONTENT_TRUNCATED_NOTICE,
     DIRECTORY_CONTENT_TRUNCATED_NOTICE,
@@ -36,6 +36,31 @@ Command = Literal[
 ]
 
 
+# Bytes sniffed from the head of a file when deciding whether it is binary
+_BINARY_SNIFF_SIZE = 8192
+
+_UNICODE_BOMS = (
+    codecs.BOM_UTF32_LE,
+    codecs.BOM_UTF32_BE,
+    codecs.BOM_UTF16_LE,
+    codecs.BOM_UTF16_BE,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_binary(path: str, ino: int, size: int, mtime_ns: int, ctime_ns: int) -> bool:
+    # Keyed on the stat result so a file that changes on disk is sniffed again,
+    # while repeated views and edits of an unchanged file skip the read. The inode
+    # catches atomic-rename replacements and ctime catches rewrites that keep the
+    # size and mtime, but a same-size rewrite within one timestamp tick of a
+    # filesystem with coarse timestamps can still return the stale result.
+    # Like git, treat a NUL byte near the start as binary; UTF-16/32 text is full
+    # of NULs, so a leading byte order mark exempts it.
+    with open(path, 'rb') as f:
+        head = f.read(_BINARY_SNIFF_SIZE)
+    return b'\x00' in head and not head.startswith(_UNICODE_BOMS)
+
+
 class OHEditor:
     """
     An filesystem editor tool that allows the agent to
@@ -50,18 +75,20 @@ class OHEditor:
 
     TOOL_NAME = 'oh_editor'
     MAX_FILE_SIZE_MB = 10  # Maximum file size in MB
-    SUPPORTED_BINARY_EXTENSIONS = [
-        # Office files
-        '.docx',
-        '.xlsx',
-        '.pptx',
-        '.pdf',
-        # Audio files
-        '.mp3',
-        '.wav',
-        '.m4a',
-        '.flac',
-    ]
+    SUPPORTED_BINARY_EXTENSIONS = frozenset(
+        {
+            # Office files
+            '.docx',
+            '.xlsx',
+            '.pptx',
+            '.pdf',
+            # Audio files
+            '.mp3',
+            '.wav',
+            '.m4a',
+            '.flac',
+        }
+    )
 
     def __init__(
         self,
@@ -85,9 +112,6 @@ class OHEditor:
         # Initialize encoding manager
         self._encoding_manager = EncodingManager()
 
-        # Initialize Markdown converter
-        self._markdown_converter = MarkdownConverter()
-
         # Set cwd (current working directory) if workspace_root is provided
         if workspace_root is not None:
             workspace_path = Path(workspace_root)
@@ -268,8 +292,20 @@ class OHEditor:
 
             # First count hidden files/dirs in current directory only
             # -mindepth 1 excludes . and .. automatically
+            # The commands are passed as argv lists, so no shell is spawned and
+            # the path needs no quoting
             _, hidden_stdout, _ = run_shell_cmd(
-                rf"find -L {path} -mindepth 1 -maxdepth 1 -name '.*'"
+                [
+                    'find',
+                    '-L',
+                    str(path),
+                    '-mindepth',
+                    '1',
+                    '-maxdepth',
+                    '1',
+                    '-name',
+                    '.*',
+                ]
             )
             hidden_count = (
                 len(hidden_stdout.strip().split('\n')) if hidden_stdout.strip() else 0
@@ -277,7 +313,31 @@ class OHEditor:
 
             # Then get files/dirs up to 2 levels deep, excluding hidden entries at both depth 1 and 2
             _, stdout, stderr = run_shell_cmd(
-                rf"find -L {path} -maxdepth 2 -not \( -path '{path}/\.*' -o -path '{path}/*/\.*' \) | sort",
+                [
+                    'find',
+                    '-L',
+                    str(path),
+                    '-maxdepth',
+                    '2',
+                    '-not',
+                    '(',
+                    '-path',
+                    f'{path}/.*',
+                    '-o',
+                    '-path',
+                    f'{path}/*/.*',
+                    ')',
+                ],
+                truncate_after=MAX_DIRECTORY_LISTING_CHAR,
+                truncate_notice='',
+            )
+            entries = stdout.splitlines()
+            if stdout and not stdout.endswith('\n'):
+                # The capture was cut mid-entry, so drop the partial last path
+                entries.pop()
+            # Sort in-process instead of piping through `sort`, then truncate
+            stdout = maybe_truncate(
+                '\n'.join(sorted(entries)),
                 truncate_notice=DIRECTORY_CONTENT_TRUNCATED_NOTICE,
             )
             if not stderr:
@@ -379,20 +439,35 @@ class OHEditor:
         )
 
     @with_encoding
-    def write_file(self, path: Path, file_text: str, encoding: str = 'utf-8') -> None:
+    def write_file(
+        self,
+        path: Path,
+        file_text: str | bytes | bytearray | memoryview,
+        encoding: str = 'utf-8',
+    ) -> None:
         """
         Write the content of a file to a given path; raise a ToolError if an error occurs.
 
         Args:
             path: Path to the file to write
-            file_text: Content to write to the file
+            file_text: Content to write to the file. Bytes-like content is written as-is.
             encoding: The encoding to use when writing the file (auto-detected by decorator)
         """
         self.validate_file(path)
         try:
-            # Use open with encoding instead of path.write_text
-            with open(path, 'w', encoding=encoding) as f:
-                f.write(file_text)
+            # Encode once and write the raw bytes, bypassing the TextIOWrapper layer
+            if isinstance(file_text, (bytes, bytearray, memoryview)):
+                data = memoryview(file_text).cast('B')
+            else:
+                data = memoryview(file_text.encode(encoding))
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(path, flags, 0o666)
+            try:
+                # os.write may write fewer bytes than requested
+                while data:
+                    data = data[os.write(fd, data) :]
+            finally:
+                os.close(fd)
         except Exception as e:
             raise ToolError(f'Ran into {e} while trying to write to {path}') from None
 
@@ -575,12 +650,18 @@ class OHEditor:
         Raises:
             FileValidationError: If the file fails validation
         """
+        # A single stat call covers the existence, type and size checks
+        try:
+            file_stat = path.stat()
+        except OSError:
+            return
+
         # Skip validation for directories or non-existent files (for create command)
-        if not path.exists() or not path.is_file():
+        if not stat.S_ISREG(file_stat.st_mode):
             return
 
         # Check file size
-        file_size = os.path.getsize(path)
+        file_size = file_stat.st_size
         max_size = self._max_file_size
         if file_size > max_size:
             raise FileValidationError(
@@ -593,7 +674,13 @@ class OHEditor:
             return
 
         # Check file type
-        if is_binary(str(path)):
+        if _is_binary(
+            str(path),
+            file_stat.st_ino,
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+            file_stat.st_ctime_ns,
+        ):
             raise FileValidationError(
                 path=str(path),
                 reason='File appears to be binary and this file type cannot be read or edited by this tool.',
@@ -639,6 +726,14 @@ class OHEditor:
         except Exception as e:
             raise ToolError(f'Ran into {e} while trying to read {path}') from None
 
+    @functools.cached_property
+    def _markdown_converter(self):
+        # The converter pulls in pandas, pdfminer, pptx and friends, so it is only
+        # imported and built the first time a binary document is viewed
+        from .md_converter import MarkdownConverter  # type: ignore
+
+        return MarkdownConverter()
+
     def read_file_markdown(self, path: Path) -> str:
         try:
             result = self._markdown_converter.convert(str(path))
@@ -666,27 +761,30 @@ class OHEditor:
             snippet_content = maybe_truncate(
                 snippet_content, truncate_notice=BINARY_FILE_CONTENT_TRUNCATED_NOTICE
             )
-            return (
-                f"Here's the content of the file {snippet_description} displayed in Markdown format:\n"
-                + snippet_content
-                + '\n'
+            return ''.join(
+                (
+                    f"Here's the content of the file {snippet_description} displayed in Markdown format:\n",
+                    snippet_content,
+                    '\n',
+                )
             )
 
         snippet_content = maybe_truncate(
             snippet_content, truncate_notice=TEXT_FILE_CONTENT_TRUNCATED_NOTICE
         )
 
-        snippet_content = '\n'.join(
+        # Build the header, numbered lines and trailing newline with a single
+        # join instead of chained concatenations that copy the snippet each time
+        return '\n'.join(
             [
-                f'{i + start_line:6}\t{line}'
-                for i, line in enumerate(snippet_content.split('\n'))
+                f"Here's the result of running `cat -n` on {snippet_description}:",
+                *(
+                    f'{i + start_line:6}\t{line}'
+                    for i, line in enumerate(snippet_content.split('\n'))
+                ),
+                '',
             ]
         )
-        return (
-            f"Here's the result of running `cat -n` on {snippet_description}:\n"
-            + snippet_content
-            + '\n'
-        )
 
     def _run_linting(self, old_content: str, new_content: str, path: Path) -> str:
         """
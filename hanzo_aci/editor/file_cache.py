@@ -18,7 +18,10 @@ class FileCache:
         self.current_size = 0
         self._update_current_size()
         logger.debug(
-            f'FileCache initialized with directory: {self.directory}, size_limit: {self.size_limit}, current_size: {self.current_size}'
+            'FileCache initialized with directory: %s, size_limit: %s, current_size: %s',
+            self.directory,
+            self.size_limit,
+            self.current_size,
         )
 
     def _get_file_path(self, key: str) -> Path:
@@ -29,20 +32,20 @@ class FileCache:
         self.current_size = sum(
             f.stat().st_size for f in self.directory.glob('*.json') if f.is_file()
         )
-        logger.debug(f'Current size updated: {self.current_size}')
+        logger.debug('Current size updated: %s', self.current_size)
 
     def set(self, key: str, value: Any) -> None:
         file_path = self._get_file_path(key)
         content = json.dumps({'key': key, 'value': value})
         content_size = len(content.encode('utf-8'))
-        logger.debug(f'Setting key: {key}, content_size: {content_size}')
+        logger.debug('Setting key: %s, content_size: %s', key, content_size)
 
         if self.size_limit is not None:
             if file_path.exists():
                 old_size = file_path.stat().st_size
                 size_diff = content_size - old_size
                 logger.debug(
-                    f'Existing file: old_size: {old_size}, size_diff: {size_diff}'
+                    'Existing file: old_size: %s, size_diff: %s', old_size, size_diff
                 )
                 if size_diff > 0:
                     while (
@@ -50,7 +53,9 @@ class FileCache:
                         and len(self) > 1
                     ):
                         logger.debug(
-                            f'Evicting oldest (existing file case): current_size: {self.current_size}, size_limit: {self.size_limit}'
+                            'Evicting oldest (existing file case): current_size: %s, size_limit: %s',
+                            self.current_size,
+                            self.size_limit,
                         )
                         self._evict_oldest(file_path)
             else:
@@ -58,21 +63,23 @@ class FileCache:
                     self.current_size + content_size > self.size_limit and len(self) > 1
                 ):
                     logger.debug(
-                        f'Evicting oldest (new file case): current_size: {self.current_size}, size_limit: {self.size_limit}'
+                        'Evicting oldest (new file case): current_size: %s, size_limit: %s',
+                        self.current_size,
+                        self.size_limit,
                     )
                     self._evict_oldest(file_path)
 
         if file_path.exists():
             self.current_size -= file_path.stat().st_size
             logger.debug(
-                f'Existing file removed from current_size: {self.current_size}'
+                'Existing file removed from current_size: %s', self.current_size
             )
 
         with open(file_path, 'w') as f:
             f.write(content)
 
         self.current_size += content_size
-        logger.debug(f'File written, new current_size: {self.current_size}')
+        logger.debug('File written, new current_size: %s', self.current_size)
         os.utime(
             file_path, (time.time(), time.time())
         )  # Update access and modification time
@@ -90,18 +97,21 @@ class FileCache:
         self.current_size -= evicted_size
         os.remove(oldest_file)
         logger.debug(
-            f'Evicted file: {oldest_file}, size: {evicted_size}, new current_size: {self.current_size}'
+            'Evicted file: %s, size: %s, new current_size: %s',
+            oldest_file,
+            evicted_size,
+            self.current_size,
         )
 
     def get(self, key: str, default: Any = None) -> Any:
         file_path = self._get_file_path(key)
         if not file_path.exists():
-            logger.debug(f'Get: Key not found: {key}')
+            logger.debug('Get: Key not found: %s', key)
             return default
         with open(file_path, 'r') as f:
             data = json.load(f)
             os.utime(file_path, (time.time(), time.time()))  # Update access time
-            logger.debug(f'Get: Key found: {key}')
+            logger.debug('Get: Key found: %s', key)
             return data['value']
 
     def delete(self, key: str) -> None:
@@ -111,7 +121,10 @@ class FileCache:
             self.current_size -= deleted_size
             os.remove(file_path)
             logger.debug(
-                f'Deleted key: {key}, size: {deleted_size}, new current_size: {self.current_size}'
+                'Deleted key: %s, size: %s, new current_size: %s',
+                key,
+                deleted_size,
+                self.current_size,
             )
 
     def clear(self) -> None:
@@ -123,12 +136,12 @@ class FileCache:
 
     def __contains__(self, key: str) -> bool:
         exists = self._get_file_path(key).exists()
-        logger.debug(f'Contains check: {key}, result: {exists}')
+        logger.debug('Contains check: %s, result: %s', key, exists)
         return exists
 
     def __len__(self) -> int:
         length = sum(1 for _ in self.directory.glob('*.json') if _.is_file())
-        logger.debug(f'Cache length: {length}')
+        logger.debug('Cache length: %s', length)
         return length
 
     def __iter__(self):
@@ -136,7 +149,7 @@ class FileCache:
             if file.is_file():
                 with open(file, 'r') as f:
                     data = json.load(f)
-                    logger.debug(f"Yielding key: {data['key']}")
+                    logger.debug('Yielding key: %s', data['key'])
                     yield data['key']
 
     def __getitem__(self, key: str) -> Any:
@@ -2,6 +2,7 @@
 # type: ignore
 import base64
 import copy
+import functools
 import html
 import json
 import mimetypes
@@ -30,6 +31,13 @@ from bs4 import BeautifulSoup
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.formatters import SRTFormatter
 
+
+@functools.cache
+def _which(cmd):
+    # Cache PATH lookups: shutil.which stats every PATH entry on each call
+    return shutil.which(cmd)
+
+
 # Conditionally import pydub and check for ffmpeg availability
 pydub = None
 pydub_available = False
@@ -40,13 +48,15 @@ try:
         import pydub
 
         # Check if ffmpeg or avconv is available
-        from pydub.utils import which
-
-        if which('ffmpeg') or which('avconv'):
+        if _which('ffmpeg') or _which('avconv'):
             pydub_available = True
 except (ImportError, RuntimeError):
     pass
 
+# Compiled once; used to normalize the output of every conversion
+_LINE_BREAK_RE = re.compile(r'\r?\n')
+_EXCESS_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
 
 class _CustomMarkdownify(markdownify.MarkdownConverter):
     """
@@ -682,7 +692,7 @@ class MediaConverter(DocumentConverter):
     """
 
     def _get_metadata(self, local_path):
-        exiftool = shutil.which('exiftool')
+        exiftool = _which('exiftool')
         if not exiftool:
             return None
         else:
@@ -1136,9 +1146,14 @@ class MarkdownConverter:
                 if res is not None:
                     # Normalize the content
                     res.text_content = '\n'.join(
-                        [line.rstrip() for line in re.split(r'\r?\n', res.text_content)]
+                        [
+                            line.rstrip()
+                            for line in _LINE_BREAK_RE.split(res.text_content)
+                        ]
+                    )
+                    res.text_content = _EXCESS_BLANK_LINES_RE.sub(
+                        '\n\n', res.text_content
                     )
-                    res.text_content = re.sub(r'\n{3,}', '\n\n', res.text_content)
 
                     # Todo
                     return res
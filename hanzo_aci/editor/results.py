@@ -1,4 +1,4 @@
-from dataclasses import asdict, dataclass, fields
+from dataclasses import dataclass, fields
 
 from .config import MAX_RESPONSE_LEN_CHAR
 from .prompts import CONTENT_TRUNCATED_NOTICE
@@ -15,7 +15,9 @@ class ToolResult:
         return any(getattr(self, field.name) for field in fields(self))
 
     def to_dict(self, extra_field: dict | None = None) -> dict:
-        result = asdict(self)
+        # All fields are flat, so read them directly rather than deep-copying
+        # through dataclasses.asdict
+        result = {field.name: getattr(self, field.name) for field in fields(self)}
 
         # Add extra fields if provided
         if extra_field:
@@ -29,6 +29,11 @@ commented_out_keywords = ['rest of the code', 'existing code', 'other code']
 child_block_types = ['ERROR', 'block']
 module_types = ['program', 'module']
 
+# Compiled tree-sitter queries keyed by query file. A parser is built per file
+# while indexing, and the queries are only read after compilation, so every
+# parser for a language can share them.
+_compiled_queries: dict[str, list] = {}
+
 # logger = logging.getLogger(__name__)
 
 
@@ -121,6 +126,10 @@ class CodeParser:
             return None
 
     def _build_queries(self, query_file: str):
+        cached = _compiled_queries.get(query_file)
+        if cached is not None:
+            return cached
+
         with resources.open_text(
             'hanzo_aci.indexing.locagent.repo.chunk_index.codeblocks.parser.queries', query_file
         ) as file:
@@ -137,8 +146,9 @@ class CodeParser:
                         )
                     )
                 except Exception as e:
-                    logging.error(f'Could not parse query {query}:{i+1}')
+                    logging.error('Could not parse query %s:%s', query, i + 1)
                     raise e
+            _compiled_queries[query_file] = parsed_queries
             return parsed_queries
 
     def parse_code(
@@ -202,7 +202,7 @@ class EpicSplitter(NodeParser):
     ) -> list[CodeBlockChunk]:
         tokens = codeblock.sum_tokens()
         if tokens == 0:
-            logger.debug(f'Skipping file {file_path} because it has no tokens.')
+            logger.debug('Skipping file %s because it has no tokens.', file_path)
             return []
 
         if codeblock.find_errors():
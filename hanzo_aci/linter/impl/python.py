@@ -26,7 +26,7 @@ def python_compile_lint(fname: str) -> list[LintResult]:
 
 def flake_lint(filepath: str) -> list[LintResult]:
     fatal = 'F821,F822,F831,E112,E113,E999,E902'
-    flake8_cmd = f'flake8 --select={fatal} --isolated {filepath}'
+    flake8_cmd = ['flake8', f'--select={fatal}', '--isolated', filepath]
 
     try:
         cmd_outputs = run_shell_cmd(flake8_cmd, truncate_after=None)[1]
@@ -1,8 +1,10 @@
+import functools
 import warnings
 
 from grep_ast import TreeContext, filename_to_lang
 from grep_ast.parsers import PARSERS
-from tree_sitter_language_pack import get_parser
+from tree_sitter import Parser
+from tree_sitter_language_pack import get_language
 
 from ..base import BaseLinter, LintResult
 
@@ -10,6 +12,13 @@ from ..base import BaseLinter, LintResult
 warnings.simplefilter('ignore', category=FutureWarning)
 
 
+@functools.cache
+def _get_language(lang):
+    # Loading a grammar is the costly part and a Language can be shared; a Parser
+    # is not safe to use from several threads, so lint() builds one per call
+    return get_language(lang)
+
+
 def tree_context(fname, code, line_nums):
     context = TreeContext(
         fname,
@@ -56,7 +65,7 @@ class TreesitterBasicLinter(BaseLinter):
         lang = filename_to_lang(file_path)
         if not lang:
             return []
-        parser = get_parser(lang)
+        parser = Parser(_get_language(lang))
         with open(file_path, 'r') as f:
             code = f.read()
         tree = parser.parse(bytes(code, 'utf-8'))
@@ -1,22 +1,95 @@
 import os
+import shlex
+import signal
 import subprocess
+import sys
+import threading
 import time
+from collections.abc import Sequence
+from typing import IO, Any
 
 from hanzo_aci.editor.config import MAX_RESPONSE_LEN_CHAR
 from hanzo_aci.editor.prompts import CONTENT_TRUNCATED_NOTICE
 from hanzo_aci.editor.results import maybe_truncate
 
+# Number of bytes read from a pipe at a time
+_READ_CHUNK_SIZE = 65536
+
+# A UTF-8 character takes at most this many bytes
+_MAX_BYTES_PER_CHAR = 4
+
+
+def _drain(
+    stream: IO[bytes],
+    limit: int | None,
+    buffer: bytearray,
+    errors: list[BaseException],
+) -> None:
+    """Read a pipe until EOF, keeping at most `limit` bytes in `buffer`.
+
+    The pipe is always read to the end so that the child process never blocks on
+    a full pipe buffer, even after the limit has been reached. Runs in a reader
+    thread, so any exception is recorded in `errors` for the caller to re-raise.
+    """
+    try:
+        while chunk := stream.read(_READ_CHUNK_SIZE):
+            if limit is None:
+                buffer += chunk
+            elif len(buffer) < limit:
+                buffer += chunk[: limit - len(buffer)]
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        stream.close()
+
+
+def _decode(buffer: bytearray) -> str:
+    """Decode captured output, translating newlines as text-mode pipes would."""
+    text = buffer.decode('utf-8', errors='replace')
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _kill_process_group(process: subprocess.Popen, grace_period: float = 1.0) -> None:
+    """Terminate a process started by run_shell_cmd along with its descendants.
+
+    The process leads its own session (POSIX) or process group (Windows), so every
+    child it spawned is signalled too, not only the shell wrapper.
+    """
+    if sys.platform == 'win32':
+        process.send_signal(signal.CTRL_BREAK_EVENT)
+        try:
+            process.wait(timeout=grace_period)
+        except subprocess.TimeoutExpired:
+            process.kill()
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            process.wait(timeout=grace_period)
+        except subprocess.TimeoutExpired:
+            pass
+        except ProcessLookupError:
+            return
+        try:
+            # Also catch descendants that outlived the group leader
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
 
 def run_shell_cmd(
-    cmd: str,
+    cmd: str | Sequence[str],
     timeout: float | None = 120.0,  # seconds
     truncate_after: int | None = MAX_RESPONSE_LEN_CHAR,
     truncate_notice: str = CONTENT_TRUNCATED_NOTICE,
 ) -> tuple[int, str, str]:
     """Run a shell command synchronously with a timeout.
 
+    Output is read incrementally and only the first `truncate_after` characters of
+    each stream are kept, so memory stays bounded for very chatty commands.
+
     Args:
-        cmd: The shell command to run.
+        cmd: The shell command to run. An argument sequence is executed directly,
+            without spawning an intermediate shell.
         timeout: The maximum time to wait for the command to complete.
         truncate_after: The maximum number of characters to return for stdout and stderr.
 
@@ -24,31 +97,78 @@ def run_shell_cmd(
         A tuple containing the return code, stdout, and stderr.
     """
 
-    start_time = time.time()
+    start_time = time.monotonic()
+
+    # Run in a new process group so a timeout can kill the whole tree
+    group_kwargs: dict[str, Any]
+    if sys.platform == 'win32':
+        group_kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_kwargs = {'start_new_session': True}
 
     try:
         process = subprocess.Popen(
-            cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+            cmd,
+            shell=isinstance(cmd, str),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **group_kwargs,
         )
 
-        stdout, stderr = process.communicate(timeout=timeout)
+        # Keep enough bytes for one extra character so maybe_truncate can tell the
+        # output was cut
+        limit = (truncate_after + 1) * _MAX_BYTES_PER_CHAR if truncate_after else None
+        stdout_buffer = bytearray()
+        stderr_buffer = bytearray()
+        reader_errors: list[BaseException] = []
+        readers = [
+            threading.Thread(
+                target=_drain,
+                args=(process.stdout, limit, stdout_buffer, reader_errors),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=_drain,
+                args=(process.stderr, limit, stderr_buffer, reader_errors),
+                daemon=True,
+            ),
+        ]
+        for reader in readers:
+            reader.start()
+
+        process.wait(timeout=timeout)
+        # A backgrounded child can hold the pipes open after the shell exits, so
+        # the readers share what is left of the timeout
+        for reader in readers:
+            if timeout is None:
+                reader.join()
+                continue
+            reader.join(max(0.0, start_time + timeout - time.monotonic()))
+            if reader.is_alive():
+                raise subprocess.TimeoutExpired(cmd, timeout)
+        if reader_errors:
+            raise reader_errors[0]
 
         return (
             process.returncode or 0,
             maybe_truncate(
-                stdout, truncate_after=truncate_after, truncate_notice=truncate_notice
+                _decode(stdout_buffer),
+                truncate_after=truncate_after,
+                truncate_notice=truncate_notice,
             ),
             maybe_truncate(
-                stderr,
+                _decode(stderr_buffer),
                 truncate_after=truncate_after,
                 truncate_notice=CONTENT_TRUNCATED_NOTICE,
             ),  # Use generic notice for stderr
         )
     except subprocess.TimeoutExpired:
-        process.kill()
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.monotonic() - start_time
+        _kill_process_group(process)
+        process.wait()
+        cmd_str = cmd if isinstance(cmd, str) else shlex.join(cmd)
         raise TimeoutError(
-            f"Command '{cmd}' timed out after {elapsed_time:.2f} seconds"
+            f"Command '{cmd_str}' timed out after {elapsed_time:.2f} seconds"
         )
 
 
@@ -1,9 +1,20 @@
 """Tests for error handling in file editor."""
 
+import pytest
+
 from hanzo_aci.editor import file_editor
 
 from .conftest import parse_result
 
+_THREE_LINES = 'line 1\nline 2\nline 3\n'
+
+
+@pytest.fixture
+def three_line_file(temp_file):
+    """Seed the temporary file with three short lines."""
+    temp_file.write_text(_THREE_LINES)
+    return temp_file
+
 
 def test_validation_error_formatting():
     """Test that validation errors are properly formatted in the output."""
@@ -32,17 +43,12 @@ def test_validation_error_formatting():
     assert 'directory and only the `view` command' in result_json['error']
 
 
-def test_str_replace_error_handling(temp_file):
+def test_str_replace_error_handling(three_line_file):
     """Test error handling in str_replace command."""
-    # Create a test file
-    content = 'line 1\nline 2\nline 3\n'
-    with open(temp_file, 'w') as f:
-        f.write(content)
-
     # Test non-existent string
     result = file_editor(
         command='str_replace',
-        path=temp_file,
+        path=three_line_file,
         old_str='nonexistent',
         new_str='something',
         enable_linting=False,
@@ -52,12 +58,12 @@ def test_str_replace_error_handling(temp_file):
     assert 'did not appear verbatim' in result_json['error']
 
     # Test multiple occurrences
-    with open(temp_file, 'w') as f:
+    with open(three_line_file, 'w') as f:
         f.write('line\nline\nother')
 
     result = file_editor(
         command='str_replace',
-        path=temp_file,
+        path=three_line_file,
         old_str='line',
         new_str='new_line',
         enable_linting=False,
@@ -67,17 +73,12 @@ def test_str_replace_error_handling(temp_file):
     assert 'lines [1, 2]' in result_json['error']
 
 
-def test_view_range_validation(temp_file):
+def test_view_range_validation(three_line_file):
     """Test validation of view_range parameter."""
-    # Create a test file
-    content = 'line 1\nline 2\nline 3\n'
-    with open(temp_file, 'w') as f:
-        f.write(content)
-
     # Test invalid range format
     result = file_editor(
         command='view',
-        path=temp_file,
+        path=three_line_file,
         view_range=[1],  # Should be [start, end]
         enable_linting=False,
     )
@@ -89,7 +90,7 @@ def test_view_range_validation(temp_file):
     # Test out of bounds range
     result = file_editor(
         command='view',
-        path=temp_file,
+        path=three_line_file,
         view_range=[1, 10],  # File only has 3 lines
         enable_linting=False,
     )
@@ -102,7 +103,7 @@ def test_view_range_validation(temp_file):
     # Test invalid range order
     result = file_editor(
         command='view',
-        path=temp_file,
+        path=three_line_file,
         view_range=[3, 1],  # End before start
         enable_linting=False,
     )
@@ -113,17 +114,12 @@ def test_view_range_validation(temp_file):
     )
 
 
-def test_insert_validation(temp_file):
+def test_insert_validation(three_line_file):
     """Test validation in insert command."""
-    # Create a test file
-    content = 'line 1\nline 2\nline 3\n'
-    with open(temp_file, 'w') as f:
-        f.write(content)
-
     # Test insert at negative line
     result = file_editor(
         command='insert',
-        path=temp_file,
+        path=three_line_file,
         insert_line=-1,
         new_str='new line',
         enable_linting=False,
@@ -134,7 +130,7 @@ def test_insert_validation(temp_file):
     # Test insert beyond file length
     result = file_editor(
         command='insert',
-        path=temp_file,
+        path=three_line_file,
         insert_line=10,
         new_str='new line',
         enable_linting=False,
@@ -143,17 +139,12 @@ def test_insert_validation(temp_file):
     assert 'should be within the range' in result_json['formatted_output_and_error']
 
 
-def test_undo_validation(temp_file):
+def test_undo_validation(three_line_file):
     """Test undo_edit validation."""
-    # Create a test file
-    content = 'line 1\nline 2\nline 3\n'
-    with open(temp_file, 'w') as f:
-        f.write(content)
-
     # Try to undo without any previous edits
     result = file_editor(
         command='undo_edit',
-        path=temp_file,
+        path=three_line_file,
         enable_linting=False,
     )
     result_json = parse_result(result)
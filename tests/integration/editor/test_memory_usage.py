@@ -19,9 +19,10 @@ def test_file_read_memory_usage(temp_file):
     num_lines = int((file_size_mb * 1024 * 1024) // line_size)
 
     print(f'\nCreating test file with {num_lines} lines...')
+    padding = 'x' * (line_size - 10) + '\n'
     with open(temp_file, 'w') as f:
         for i in range(num_lines):
-            f.write(f'Line {i}: ' + 'x' * (line_size - 10) + '\n')
+            f.write(f'Line {i}: {padding}')
 
     actual_size = os.path.getsize(temp_file) / (1024 * 1024)
     print(f'File created, size: {actual_size:.2f} MB')
@@ -11,6 +11,14 @@ from hanzo_aci.editor.encoding import EncodingManager
 
 from .conftest import parse_result
 
+_CP1251_SAMPLE_BYTES = (
+    '# -*- coding: cp1251 -*-\n\n'
+    '# Тестовый файл с кириллицей\n'
+    'text = "Привет, мир!"\n'
+    'numbers = [1, 2, 3, 4, 5]\n'
+    'message = "Это тестовая строка"\n'
+).encode('cp1251')
+
 
 @pytest.fixture
 def temp_non_utf8_file():
@@ -20,11 +28,7 @@ def temp_non_utf8_file():
 
     # Create a file with cp1251 encoding containing Russian text
     with open(path, 'wb') as f:
-        f.write('# -*- coding: cp1251 -*-\n\n'.encode('cp1251'))
-        f.write('# Тестовый файл с кириллицей\n'.encode('cp1251'))
-        f.write('text = "Привет, мир!"\n'.encode('cp1251'))
-        f.write('numbers = [1, 2, 3, 4, 5]\n'.encode('cp1251'))
-        f.write('message = "Это тестовая строка"\n'.encode('cp1251'))
+        f.write(_CP1251_SAMPLE_BYTES)
 
     yield Path(path)
     os.unlink(path)
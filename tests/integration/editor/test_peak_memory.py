@@ -1,5 +1,7 @@
 """Tests for peak memory usage in file operations."""
 
+import gc
+import logging
 import os
 import platform
 import tempfile
@@ -9,6 +11,7 @@ import psutil
 import pytest
 
 from hanzo_aci.editor import file_editor
+from hanzo_aci.editor.history import FileHistoryManager
 
 # Skip all tests in this module on non-Unix platforms
 pytestmark = pytest.mark.skipif(
@@ -39,9 +42,11 @@ def create_test_file(path: Path, size_mb: float = 5.0):
     num_lines = int((size_mb * 1024 * 1024) // line_size)
 
     print(f'\nCreating test file with {num_lines} lines...')
+    # Build the line padding once instead of on every line
+    padding = 'x' * (line_size - 30) + '\n'
     with open(path, 'w') as f:
         for i in range(num_lines):
-            f.write(f'Line {i}: ' + 'x' * (line_size - 30) + '\n')
+            f.write(f'Line {i}: {padding}')
 
     actual_size = os.path.getsize(path)
     print(f'File created, size: {actual_size / 1024 / 1024:.2f} MB')
@@ -95,8 +100,6 @@ def test_str_replace_peak_memory():
         file_size = create_test_file(path)
 
         # Force Python to release file handles and clear buffers
-        import gc
-
         gc.collect()
 
         # Get initial memory usage
@@ -132,8 +135,6 @@ def test_insert_peak_memory():
         file_size = create_test_file(path)
 
         # Force Python to release file handles and clear buffers
-        import gc
-
         gc.collect()
 
         # Get initial memory usage
@@ -169,8 +170,6 @@ def test_view_peak_memory():
         file_size = create_test_file(path)
 
         # Force Python to release file handles and clear buffers
-        import gc
-
         gc.collect()
 
         # Get initial memory usage
@@ -205,8 +204,6 @@ def test_view_full_file_peak_memory():
         file_size = create_test_file(path, size_mb=5.0)  # Smaller file for full view
 
         # Force Python to release file handles and clear buffers
-        import gc
-
         gc.collect()
 
         # Get initial memory usage
@@ -235,11 +232,6 @@ def test_view_full_file_peak_memory():
 
 def test_large_history_insert():
     """Test inserting a large amount of data into the history cache."""
-    import logging
-    import tempfile
-
-    from hanzo_aci.editor.history import FileHistoryManager
-
     # Set up logging
     logging.basicConfig(level=logging.ERROR)
 
@@ -5,9 +5,20 @@ import tempfile
 
 import pytest
 
-from hanzo_aci.indexing.locagent.repo.chunk_index.code_retriever import (
-    build_code_retriever_from_repo as build_code_retriever,
-)
+
+@pytest.fixture(scope='module')
+def build_code_retriever():
+    """Import the retriever builder only when a test needs it.
+
+    It pulls in llama-index, which is an optional extra, so collection stays cheap
+    and the test is skipped when the extra is not installed.
+    """
+    pytest.importorskip('llama_index.retrievers.bm25')
+    from hanzo_aci.indexing.locagent.repo.chunk_index.code_retriever import (
+        build_code_retriever_from_repo,
+    )
+
+    return build_code_retriever_from_repo
 
 
 @pytest.fixture(scope='module')
@@ -28,10 +39,11 @@ def persist_dir():
     shutil.rmtree(path)
 
 
+@pytest.mark.slow
 @pytest.mark.skipif(
     os.getenv('CI') == 'true', reason='Skip resource-intensive test in CI'
 )
-def test_build_code_retriever(cloned_repo, persist_dir):
+def test_build_code_retriever(build_code_retriever, cloned_repo, persist_dir):
     retriever = build_code_retriever(
         repo_path=cloned_repo,
         persist_path=persist_dir,
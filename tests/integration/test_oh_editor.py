@@ -1,3 +1,5 @@
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -104,12 +106,13 @@ def test_create_with_empty_string(editor):
     assert '1\t' in result.output  # Check for empty line
 
 
-def test_create_with_none_file_text(editor):
+def test_write_file_with_bytes(editor):
     editor, test_file = editor
-    new_file = test_file.parent / 'none_content.txt'
-    with pytest.raises(EditorToolParameterMissingError) as exc_info:
-        editor(command='create', path=str(new_file), file_text=None)
-    assert 'file_text' in str(exc_info.value.message)
+    editor.write_file(test_file, b'Bytes content\n')
+    assert test_file.read_bytes() == b'Bytes content\n'
+
+    editor.write_file(test_file, memoryview(bytearray(b'Shorter')))
+    assert test_file.read_bytes() == b'Shorter'
 
 
 def test_str_replace_no_linting(editor):
@@ -275,18 +278,6 @@ def test_str_replace_with_empty_old_str(editor):
     )
 
 
-def test_str_replace_with_none_old_str(editor):
-    editor, test_file = editor
-    with pytest.raises(EditorToolParameterMissingError) as exc_info:
-        editor(
-            command='str_replace',
-            path=str(test_file),
-            old_str=None,
-            new_str='new content',
-        )
-    assert 'old_str' in str(exc_info.value.message)
-
-
 def test_insert_no_linting(editor):
     editor, test_file = editor
     result = editor(
@@ -376,18 +367,6 @@ Review the changes and make sure they are as expected (correct indentation, no d
     )
 
 
-def test_insert_with_none_new_str(editor):
-    editor, test_file = editor
-    with pytest.raises(EditorToolParameterMissingError) as exc_info:
-        editor(
-            command='insert',
-            path=str(test_file),
-            insert_line=1,
-            new_str=None,
-        )
-    assert 'new_str' in str(exc_info.value.message)
-
-
 def test_undo_edit(editor):
     editor, test_file = editor
     # Make an edit to be undone
@@ -446,10 +425,23 @@ def test_create_existing_file_error(editor):
         editor(command='create', path=str(test_file), file_text='New content')
 
 
-def test_str_replace_missing_old_str(editor):
+@pytest.mark.parametrize(
+    'command, kwargs, missing',
+    [
+        ('create', {'file_text': None}, 'file_text'),
+        ('str_replace', {'new_str': 'sample'}, 'old_str'),
+        ('str_replace', {'old_str': None, 'new_str': 'new content'}, 'old_str'),
+        ('insert', {'new_str': 'Missing insert line'}, 'insert_line'),
+        ('insert', {'insert_line': 1, 'new_str': None}, 'new_str'),
+    ],
+)
+def test_missing_required_parameter(editor, command, kwargs, missing):
     editor, test_file = editor
-    with pytest.raises(EditorToolParameterMissingError):
-        editor(command='str_replace', path=str(test_file), new_str='sample')
+    # create refuses to overwrite, so it gets a path that does not exist yet
+    path = test_file.parent / 'none_content.txt' if command == 'create' else test_file
+    with pytest.raises(EditorToolParameterMissingError) as exc_info:
+        editor(command=command, path=str(path), **kwargs)
+    assert missing in str(exc_info.value.message)
 
 
 def test_str_replace_new_str_and_old_str_same(editor):
@@ -467,12 +459,6 @@ def test_str_replace_new_str_and_old_str_same(editor):
     )
 
 
-def test_insert_missing_line_param(editor):
-    editor, test_file = editor
-    with pytest.raises(EditorToolParameterMissingError):
-        editor(command='insert', path=str(test_file), new_str='Missing insert line')
-
-
 def test_undo_edit_no_history_error(editor):
     editor, test_file = editor
     empty_file = test_file.parent / 'empty.txt'
@@ -560,6 +546,22 @@ def test_view_large_directory_with_truncation(editor, tmp_path):
     assert DIRECTORY_CONTENT_TRUNCATED_NOTICE in result.output
 
 
+def test_view_directory_listing_capture_is_capped(editor, tmp_path, monkeypatch):
+    editor, _ = editor
+    monkeypatch.setattr('hanzo_aci.editor.editor.MAX_DIRECTORY_LISTING_CHAR', 200)
+    large_dir = tmp_path / 'large_dir'
+    large_dir.mkdir()
+    for i in range(100):
+        (large_dir / f'file_{i}.txt').write_text('content')
+
+    result = editor(command='view', path=str(large_dir))
+    listed = result.output.splitlines()[1:]
+    assert 0 < len(listed) < 100
+    # An entry cut off by the cap must not be listed as a path
+    for entry in listed:
+        assert Path(entry.rstrip('/')).exists()
+
+
 def test_view_directory_on_hidden_path(tmp_path):
     """Directory structure:
     .test_dir/
@@ -699,3 +701,14 @@ def test_str_replace_and_insert_snippet_output_on_a_large_file(editor):
         new_str='Inserted line at 500',
     )
     assert '   500\tInserted line at 500' in result.output
+
+
+def test_markdown_converter_is_not_imported_eagerly():
+    # Run in a fresh interpreter so imports made by other tests do not leak in
+    code = (
+        'import sys\n'
+        'from hanzo_aci.editor import OHEditor\n'
+        'OHEditor()\n'
+        "assert 'hanzo_aci.editor.md_converter' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -10,6 +10,20 @@ from hanzo_aci.editor.md_converter import (
     WavConverter,
 )
 
+_MOCK_METADATA = {
+    'Title': 'Test Song',
+    'Artist': 'Test Artist',
+    'Album': 'Test Album',
+    'Duration': '00:02:30',
+}
+
+# Converters that transcode through pydub before transcribing
+_PYDUB_CONVERTERS = [
+    (Mp3Converter, '.mp3'),
+    (M4aConverter, '.m4a'),
+    (FlacConverter, '.flac'),
+]
+
 
 class TestAudioConverters(unittest.TestCase):
     """Test all audio converter classes."""
@@ -70,69 +84,21 @@ class TestAudioConverters(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertIn('Audio Transcript:', result.text_content)
 
-    def test_wav_converter_wrong_extension(self):
-        """Test that WavConverter returns None for wrong file extension."""
-        converter = WavConverter()
-        with tempfile.NamedTemporaryFile(suffix='.mp3') as temp_file:
-            result = converter.convert(temp_file.name, file_extension='.mp3')
-            self.assertIsNone(result)
-
-    def test_mp3_converter_wrong_extension(self):
-        """Test that Mp3Converter returns None for wrong file extension."""
-        converter = Mp3Converter()
-        with tempfile.NamedTemporaryFile(suffix='.wav') as temp_file:
-            result = converter.convert(temp_file.name, file_extension='.wav')
-            self.assertIsNone(result)
-
-    def test_m4a_converter_wrong_extension(self):
-        """Test that M4aConverter returns None for wrong file extension."""
-        converter = M4aConverter()
-        with tempfile.NamedTemporaryFile(suffix='.mp3') as temp_file:
-            result = converter.convert(temp_file.name, file_extension='.mp3')
-            self.assertIsNone(result)
-
-    def test_flac_converter_wrong_extension(self):
-        """Test that FlacConverter returns None for wrong file extension."""
-        converter = FlacConverter()
-        with tempfile.NamedTemporaryFile(suffix='.mp3') as temp_file:
-            result = converter.convert(temp_file.name, file_extension='.mp3')
-            self.assertIsNone(result)
-
-    def test_mp3_converter_pydub_not_available(self):
-        """Test that Mp3Converter handles the case when pydub is not available."""
-        with mock.patch('hanzo_aci.editor.md_converter.pydub_available', False):
-            converter = Mp3Converter()
-            with tempfile.NamedTemporaryFile(suffix='.mp3') as temp_file:
-                result = converter.convert(temp_file.name, file_extension='.mp3')
-                self.assertIsNotNone(result)
-                self.assertIn(
-                    'Transcription unavailable - ffmpeg/avconv not installed',
-                    result.text_content,
-                )
-
-    def test_m4a_converter_pydub_not_available(self):
-        """Test that M4aConverter handles the case when pydub is not available."""
-        with mock.patch('hanzo_aci.editor.md_converter.pydub_available', False):
-            converter = M4aConverter()
-            with tempfile.NamedTemporaryFile(suffix='.m4a') as temp_file:
-                result = converter.convert(temp_file.name, file_extension='.m4a')
-                self.assertIsNotNone(result)
-                self.assertIn(
-                    'Transcription unavailable - ffmpeg/avconv not installed',
-                    result.text_content,
-                )
-
-    def test_flac_converter_pydub_not_available(self):
-        """Test that FlacConverter handles the case when pydub is not available."""
-        with mock.patch('hanzo_aci.editor.md_converter.pydub_available', False):
-            converter = FlacConverter()
-            with tempfile.NamedTemporaryFile(suffix='.flac') as temp_file:
-                result = converter.convert(temp_file.name, file_extension='.flac')
-                self.assertIsNotNone(result)
-                self.assertIn(
-                    'Transcription unavailable - ffmpeg/avconv not installed',
-                    result.text_content,
+    def test_converters_wrong_extension(self):
+        """Test that each audio converter returns None for a wrong file extension."""
+        for converter_cls, extension in [
+            (WavConverter, '.mp3'),
+            (Mp3Converter, '.wav'),
+            (M4aConverter, '.mp3'),
+            (FlacConverter, '.mp3'),
+        ]:
+            with self.subTest(converter=converter_cls.__name__):
+                # Converters bail out on the extension before touching the file
+                converter = converter_cls()
+                result = converter.convert(
+                    f'/nonexistent/audio{extension}', file_extension=extension
                 )
+                self.assertIsNone(result)
 
     def test_wav_converter_speech_recognition_error(self):
         """Test that WavConverter handles speech recognition errors gracefully."""
@@ -153,42 +119,6 @@ class TestAudioConverters(unittest.TestCase):
                 result.text_content,
             )
 
-    def test_mp3_converter_pydub_none(self):
-        """Test that Mp3Converter handles the case when pydub is None."""
-        with mock.patch('hanzo_aci.editor.md_converter.pydub', None):
-            converter = Mp3Converter()
-            with tempfile.NamedTemporaryFile(suffix='.mp3') as temp_file:
-                result = converter.convert(temp_file.name, file_extension='.mp3')
-                self.assertIsNotNone(result)
-                self.assertIn(
-                    'Transcription unavailable - ffmpeg/avconv not installed',
-                    result.text_content,
-                )
-
-    def test_m4a_converter_pydub_none(self):
-        """Test that M4aConverter handles the case when pydub is None."""
-        with mock.patch('hanzo_aci.editor.md_converter.pydub', None):
-            converter = M4aConverter()
-            with tempfile.NamedTemporaryFile(suffix='.m4a') as temp_file:
-                result = converter.convert(temp_file.name, file_extension='.m4a')
-                self.assertIsNotNone(result)
-                self.assertIn(
-                    'Transcription unavailable - ffmpeg/avconv not installed',
-                    result.text_content,
-                )
-
-    def test_flac_converter_pydub_none(self):
-        """Test that FlacConverter handles the case when pydub is None."""
-        with mock.patch('hanzo_aci.editor.md_converter.pydub', None):
-            converter = FlacConverter()
-            with tempfile.NamedTemporaryFile(suffix='.flac') as temp_file:
-                result = converter.convert(temp_file.name, file_extension='.flac')
-                self.assertIsNotNone(result)
-                self.assertIn(
-                    'Transcription unavailable - ffmpeg/avconv not installed',
-                    result.text_content,
-                )
-
     def test_wav_converter_transcription_error(self):
         """Test WavConverter handles transcription errors gracefully."""
         converter = WavConverter()
@@ -230,13 +160,6 @@ class TestAudioConverters(unittest.TestCase):
 
     def test_metadata_extraction_mock(self):
         """Test metadata extraction with mocked exiftool."""
-        mock_metadata = {
-            'Title': 'Test Song',
-            'Artist': 'Test Artist',
-            'Album': 'Test Album',
-            'Duration': '00:02:30',
-        }
-
         test_files = [
             ('test.wav', WavConverter()),
             ('test.mp3', Mp3Converter()),
@@ -250,16 +173,62 @@ class TestAudioConverters(unittest.TestCase):
                 self.skipTest(f'Test file not found: {file_path}')
 
             with mock.patch.object(
-                converter, '_get_metadata', return_value=mock_metadata
+                converter, '_get_metadata', return_value=_MOCK_METADATA
             ):
                 _, ext = os.path.splitext(filename)
                 result = converter.convert(file_path, file_extension=ext)
                 self.assertIsNotNone(result)
 
                 # Check that metadata is included in the output
-                for key, value in mock_metadata.items():
+                for key, value in _MOCK_METADATA.items():
                     self.assertIn(f'{key}: {value}', result.text_content)
 
 
+class TestAudioConvertersPydubNotAvailable(unittest.TestCase):
+    """Test audio converters when ffmpeg/avconv is not available to pydub."""
+
+    def setUp(self):
+        """Patch the pydub availability flag for every test in this class."""
+        patcher = mock.patch('hanzo_aci.editor.md_converter.pydub_available', False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_converters_pydub_not_available(self):
+        """Test that the pydub-backed converters handle the case when pydub is not available."""
+        for converter_cls, extension in _PYDUB_CONVERTERS:
+            with self.subTest(converter=converter_cls.__name__):
+                converter = converter_cls()
+                with tempfile.NamedTemporaryFile(suffix=extension) as temp_file:
+                    result = converter.convert(temp_file.name, file_extension=extension)
+                    self.assertIsNotNone(result)
+                    self.assertIn(
+                        'Transcription unavailable - ffmpeg/avconv not installed',
+                        result.text_content,
+                    )
+
+
+class TestAudioConvertersPydubNone(unittest.TestCase):
+    """Test audio converters when pydub is not installed."""
+
+    def setUp(self):
+        """Patch out the pydub module for every test in this class."""
+        patcher = mock.patch('hanzo_aci.editor.md_converter.pydub', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_converters_pydub_none(self):
+        """Test that the pydub-backed converters handle the case when pydub is None."""
+        for converter_cls, extension in _PYDUB_CONVERTERS:
+            with self.subTest(converter=converter_cls.__name__):
+                converter = converter_cls()
+                with tempfile.NamedTemporaryFile(suffix=extension) as temp_file:
+                    result = converter.convert(temp_file.name, file_extension=extension)
+                    self.assertIsNotNone(result)
+                    self.assertIn(
+                        'Transcription unavailable - ffmpeg/avconv not installed',
+                        result.text_content,
+                    )
+
+
 if __name__ == '__main__':
     unittest.main()
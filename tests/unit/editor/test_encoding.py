@@ -12,6 +12,17 @@ from cachetools import LRUCache
 from hanzo_aci.editor.encoding import EncodingManager, with_encoding
 
 
+class MockEditor:
+    """Minimal editor whose read_file method is decorated with with_encoding."""
+
+    def __init__(self):
+        self._encoding_manager = EncodingManager()
+
+    @with_encoding
+    def read_file(self, path, encoding='utf-8'):
+        return f'Reading file with encoding: {encoding}'
+
+
 @pytest.fixture
 def temp_file():
     """Create a temporary file for testing."""
@@ -109,21 +120,18 @@ def test_get_encoding_cache_hit(encoding_manager, temp_file):
     with open(temp_file, 'w', encoding='utf-8') as f:
         f.write('Hello, world!')
 
-    # First call should detect encoding
     with patch.object(
         encoding_manager, 'detect_encoding', return_value='utf-8'
     ) as mock_detect:
+        # First call should detect encoding
         encoding1 = encoding_manager.get_encoding(temp_file)
         assert encoding1 == 'utf-8'
         mock_detect.assert_called_once()
 
-    # Second call should use cache
-    with patch.object(
-        encoding_manager, 'detect_encoding', return_value='utf-8'
-    ) as mock_detect:
+        # Second call should use cache
         encoding2 = encoding_manager.get_encoding(temp_file)
         assert encoding2 == 'utf-8'
-        mock_detect.assert_not_called()
+        mock_detect.assert_called_once()
 
 
 def test_get_encoding_cache_invalidation(encoding_manager, temp_file):
@@ -155,43 +163,36 @@ def test_get_encoding_cache_invalidation(encoding_manager, temp_file):
 def test_with_encoding_decorator():
     """Test the with_encoding decorator."""
 
-    # Create a mock class with a method that will be decorated
-    class MockEditor:
-        def __init__(self):
-            self._encoding_manager = EncodingManager()
-
-        @with_encoding
-        def read_file(self, path, encoding='utf-8'):
-            return f'Reading file with encoding: {encoding}'
-
     editor = MockEditor()
 
     # Test with a directory
-    with patch.object(Path, 'is_dir', return_value=True):
-        with patch.object(
-            editor._encoding_manager, 'get_encoding'
-        ) as mock_get_encoding:
-            result = editor.read_file(Path('/some/dir'))
-            assert result == 'Reading file with encoding: utf-8'
-            mock_get_encoding.assert_not_called()
+    with (
+        patch.object(Path, 'is_dir', return_value=True),
+        patch.object(editor._encoding_manager, 'get_encoding') as mock_get_encoding,
+    ):
+        result = editor.read_file(Path('/some/dir'))
+        assert result == 'Reading file with encoding: utf-8'
+        mock_get_encoding.assert_not_called()
 
     # Test with a nonexistent file
-    with patch.object(Path, 'is_dir', return_value=False):
-        with patch.object(Path, 'exists', return_value=False):
-            result = editor.read_file(Path('/nonexistent/file.txt'))
-            assert (
-                result
-                == f'Reading file with encoding: {editor._encoding_manager.default_encoding}'
-            )
+    with (
+        patch.object(Path, 'is_dir', return_value=False),
+        patch.object(Path, 'exists', return_value=False),
+    ):
+        result = editor.read_file(Path('/nonexistent/file.txt'))
+        assert (
+            result
+            == f'Reading file with encoding: {editor._encoding_manager.default_encoding}'
+        )
 
     # Test with an existing file
-    with patch.object(Path, 'is_dir', return_value=False):
-        with patch.object(Path, 'exists', return_value=True):
-            with patch.object(
-                editor._encoding_manager, 'get_encoding', return_value='latin-1'
-            ):
-                result = editor.read_file(Path('/existing/file.txt'))
-                assert result == 'Reading file with encoding: latin-1'
+    with (
+        patch.object(Path, 'is_dir', return_value=False),
+        patch.object(Path, 'exists', return_value=True),
+        patch.object(editor._encoding_manager, 'get_encoding', return_value='latin-1'),
+    ):
+        result = editor.read_file(Path('/existing/file.txt'))
+        assert result == 'Reading file with encoding: latin-1'
 
 
 def test_with_encoding_respects_provided_encoding():
@@ -199,27 +200,21 @@ def test_with_encoding_respects_provided_encoding():
     # The current implementation of with_encoding always calls get_encoding
     # but doesn't override the provided encoding if it exists in kwargs
 
-    class MockEditor:
-        def __init__(self):
-            self._encoding_manager = EncodingManager()
-
-        @with_encoding
-        def read_file(self, path, encoding='utf-8'):
-            return f'Reading file with encoding: {encoding}'
-
     editor = MockEditor()
 
     # Test with explicitly provided encoding
-    with patch.object(Path, 'is_dir', return_value=False):
-        with patch.object(Path, 'exists', return_value=True):
-            with patch.object(
-                editor._encoding_manager,
-                'get_encoding',
-                return_value='detected-encoding',
-            ):
-                result = editor.read_file(Path('/some/file.txt'), encoding='iso-8859-1')
-                # The provided encoding should be used, not the detected one
-                assert result == 'Reading file with encoding: iso-8859-1'
+    with (
+        patch.object(Path, 'is_dir', return_value=False),
+        patch.object(Path, 'exists', return_value=True),
+        patch.object(
+            editor._encoding_manager,
+            'get_encoding',
+            return_value='detected-encoding',
+        ),
+    ):
+        result = editor.read_file(Path('/some/file.txt'), encoding='iso-8859-1')
+        # The provided encoding should be used, not the detected one
+        assert result == 'Reading file with encoding: iso-8859-1'
 
 
 def test_cache_size_limit(encoding_manager, temp_file):
@@ -235,19 +230,19 @@ def test_cache_size_limit(encoding_manager, temp_file):
     paths = [Path(f'{temp_file}.{i}') for i in range(4)]
 
     # Mock exists and getmtime to return consistent values
-    with patch.object(Path, 'exists', return_value=True):
-        with patch.object(os.path, 'getmtime', return_value=123456):
-            with patch.object(
-                encoding_manager, 'detect_encoding', return_value='utf-8'
-            ):
-                # Access paths in order 0, 1, 2, 3
-                for i, path in enumerate(paths):
-                    encoding_manager.get_encoding(path)
-
-                # After adding 4th item, the cache should still have 3 items
-                assert len(encoding_manager._encoding_cache) == 3
-                # Path 0 should have been evicted (LRU)
-                assert str(paths[0]) not in encoding_manager._encoding_cache
-                # Paths 1, 2, 3 should still be in the cache
-                for j in range(1, 4):
-                    assert str(paths[j]) in encoding_manager._encoding_cache
+    with (
+        patch.object(Path, 'exists', return_value=True),
+        patch.object(os.path, 'getmtime', return_value=123456),
+        patch.object(encoding_manager, 'detect_encoding', return_value='utf-8'),
+    ):
+        # Access paths in order 0, 1, 2, 3
+        for i, path in enumerate(paths):
+            encoding_manager.get_encoding(path)
+
+        # After adding 4th item, the cache should still have 3 items
+        assert len(encoding_manager._encoding_cache) == 3
+        # Path 0 should have been evicted (LRU)
+        assert str(paths[0]) not in encoding_manager._encoding_cache
+        # Paths 1, 2, 3 should still be in the cache
+        for j in range(1, 4):
+            assert str(paths[j]) in encoding_manager._encoding_cache
@@ -1,5 +1,26 @@
 import pytest
 
+from hanzo_aci.linter import DefaultLinter
+from hanzo_aci.linter.impl.python import PythonLinter
+from hanzo_aci.linter.impl.treesitter import TreesitterBasicLinter
+
+
+# Linters hold no per-call state, so one instance can serve a whole session. Runs
+# with --forked (CI and the make targets) still build one per test
+@pytest.fixture(scope='session')
+def default_linter():
+    return DefaultLinter()
+
+
+@pytest.fixture(scope='session')
+def python_linter():
+    return PythonLinter()
+
+
+@pytest.fixture(scope='session')
+def treesitter_linter():
+    return TreesitterBasicLinter()
+
 
 @pytest.fixture
 def syntax_error_py_file(tmp_path):
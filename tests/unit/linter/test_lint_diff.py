@@ -1,4 +1,4 @@
-from hanzo_aci.linter import DefaultLinter, LintResult
+from hanzo_aci.linter import LintResult
 from hanzo_aci.utils.diff import get_diff, parse_diff
 
 OLD_CONTENT = """
@@ -60,14 +60,13 @@ def test_get_and_parse_diff(tmp_path):
     assert changes[2].old is None and changes[2].new == 9 and changes[2].line == ''
 
 
-def test_lint_with_diff_append(tmp_path):
+def test_lint_with_diff_append(tmp_path, default_linter):
     with open(tmp_path / 'old.py', 'w') as f:
         f.write(OLD_CONTENT)
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(NEW_CONTENT_V1)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -80,14 +79,13 @@ def test_lint_with_diff_append(tmp_path):
     )
 
 
-def test_lint_with_diff_insert(tmp_path):
+def test_lint_with_diff_insert(tmp_path, default_linter):
     with open(tmp_path / 'old.py', 'w') as f:
         f.write(OLD_CONTENT)
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(NEW_CONTENT_V2)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -99,7 +97,7 @@ def test_lint_with_diff_insert(tmp_path):
     )
 
 
-def test_lint_with_multiple_changes_and_errors(tmp_path):
+def test_lint_with_multiple_changes_and_errors(tmp_path, default_linter):
     old_content = """
 def foo():
     print("Hello, World!")
@@ -124,8 +122,7 @@ bar()
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -142,7 +139,7 @@ bar()
     )
 
 
-def test_lint_with_introduced_and_fixed_errors(tmp_path):
+def test_lint_with_introduced_and_fixed_errors(tmp_path, default_linter):
     old_content = """
 x = UNDEFINED_VARIABLE
 y = 10
@@ -157,8 +154,7 @@ z = UNDEFINED_VARIABLE
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -175,7 +171,7 @@ z = UNDEFINED_VARIABLE
     )
 
 
-def test_lint_with_multiline_changes(tmp_path):
+def test_lint_with_multiline_changes(tmp_path, default_linter):
     old_content = """
 def complex_function(a, b, c):
     return (a +
@@ -194,8 +190,7 @@ def complex_function(a, b, c):
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -207,7 +202,7 @@ def complex_function(a, b, c):
     )
 
 
-def test_lint_with_syntax_error(tmp_path):
+def test_lint_with_syntax_error(tmp_path, default_linter):
     old_content = """
 def foo():
     print("Hello, World!")
@@ -221,8 +216,7 @@ def foo():
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -234,7 +228,7 @@ def foo():
     )
 
 
-def test_lint_with_docstring_changes(tmp_path):
+def test_lint_with_docstring_changes(tmp_path, default_linter):
     old_content = '''
 def foo():
     """This is a function."""
@@ -253,15 +247,14 @@ def foo():
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
     assert len(result) == 0  # Linter should ignore changes in docstrings
 
 
-def test_lint_with_multiple_errors_on_same_line(tmp_path):
+def test_lint_with_multiple_errors_on_same_line(tmp_path, default_linter):
     old_content = """
 def foo():
     print("Hello, World!")
@@ -279,8 +272,7 @@ foo()
     with open(tmp_path / 'new.py', 'w') as f:
         f.write(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(tmp_path / 'old.py'),
         str(tmp_path / 'new.py'),
     )
@@ -304,7 +296,7 @@ def test_parse_diff_with_empty_patch():
     assert len(changes) == 0
 
 
-def test_lint_file_diff_ignore_existing_errors(tmp_path):
+def test_lint_file_diff_ignore_existing_errors(tmp_path, default_linter):
     """
     Make sure we allow edits as long as it does not introduce new errors. In other
     words, we don't care about existing linting errors. Although they might be
@@ -329,15 +321,14 @@ def sum(a, b):
     temp_file_new_path = tmp_path / 'problematic-file-test-new.py'
     temp_file_new_path.write_text(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(temp_file_old_path),
         str(temp_file_new_path),
     )
     assert len(result) == 0  # no new errors introduced
 
 
-def test_lint_file_diff_catch_new_errors_in_edits(tmp_path):
+def test_lint_file_diff_catch_new_errors_in_edits(tmp_path, default_linter):
     """
     Make sure we catch new linting errors in our edit chunk, and at the same
     time, ignore old linting errors (in this case, the old linting error is
@@ -358,8 +349,7 @@ def sum(a, b):
     temp_file_new_path = tmp_path / 'problematic-file-test-new.py'
     temp_file_new_path.write_text(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(temp_file_old_path),
         str(temp_file_new_path),
     )
@@ -372,7 +362,7 @@ def sum(a, b):
     )
 
 
-def test_lint_file_diff_catch_new_errors_outside_edits(tmp_path):
+def test_lint_file_diff_catch_new_errors_outside_edits(tmp_path, default_linter):
     """
     Make sure we catch new linting errors induced by our edits, even
     though the error itself is not in the edit chunk
@@ -399,8 +389,7 @@ def valid_func2():
     temp_file_new_path = tmp_path / 'problematic-file-test-new.py'
     temp_file_new_path.write_text(new_content)
 
-    linter = DefaultLinter()
-    result: list[LintResult] = linter.lint_file_diff(
+    result: list[LintResult] = default_linter.lint_file_diff(
         str(temp_file_old_path),
         str(temp_file_new_path),
     )
@@ -1,16 +1,16 @@
-from hanzo_aci.linter import DefaultLinter, LintResult
+from hanzo_aci.linter import LintResult
 from hanzo_aci.linter.impl.python import (
-    PythonLinter,
     flake_lint,
     python_compile_lint,
 )
 
 
-def test_wrongly_indented_py_file(wrongly_indented_py_file):
+def test_wrongly_indented_py_file(
+    wrongly_indented_py_file, python_linter, default_linter
+):
     # Test Python linter
-    linter = PythonLinter()
-    assert '.py' in linter.supported_extensions
-    result = linter.lint(wrongly_indented_py_file)
+    assert '.py' in python_linter.supported_extensions
+    result = python_linter.lint(wrongly_indented_py_file)
     print(result)
     assert isinstance(result, list) and len(result) == 1
     assert result[0] == LintResult(
@@ -30,10 +30,9 @@ def test_wrongly_indented_py_file(wrongly_indented_py_file):
 
     # General linter should have same result as Python linter
     # bc it uses PythonLinter under the hood
-    general_linter = DefaultLinter()
-    assert '.py' in general_linter.supported_extensions
-    result = general_linter.lint(wrongly_indented_py_file)
-    assert result == linter.lint(wrongly_indented_py_file)
+    assert '.py' in default_linter.supported_extensions
+    result = default_linter.lint(wrongly_indented_py_file)
+    assert result == python_linter.lint(wrongly_indented_py_file)
 
     # Test flake8_lint
     assert result == flake_lint(wrongly_indented_py_file)
@@ -46,16 +45,14 @@ def test_wrongly_indented_py_file(wrongly_indented_py_file):
     )
 
 
-def test_simple_correct_py_file(simple_correct_py_file):
-    linter = PythonLinter()
-    assert '.py' in linter.supported_extensions
-    result = linter.lint(simple_correct_py_file)
+def test_simple_correct_py_file(simple_correct_py_file, python_linter, default_linter):
+    assert '.py' in python_linter.supported_extensions
+    result = python_linter.lint(simple_correct_py_file)
     assert result == []
 
-    general_linter = DefaultLinter()
-    assert '.py' in general_linter.supported_extensions
-    result = general_linter.lint(simple_correct_py_file)
-    assert result == linter.lint(simple_correct_py_file)
+    assert '.py' in default_linter.supported_extensions
+    result = default_linter.lint(simple_correct_py_file)
+    assert result == python_linter.lint(simple_correct_py_file)
 
     # Test python_compile_lint
     compile_result = python_compile_lint(simple_correct_py_file)
@@ -66,15 +63,15 @@ def test_simple_correct_py_file(simple_correct_py_file):
     assert flake_result == []
 
 
-def test_simple_correct_py_func_def(simple_correct_py_func_def):
-    linter = PythonLinter()
-    result = linter.lint(simple_correct_py_func_def)
+def test_simple_correct_py_func_def(
+    simple_correct_py_func_def, python_linter, default_linter
+):
+    result = python_linter.lint(simple_correct_py_func_def)
     assert result == []
 
-    general_linter = DefaultLinter()
-    assert '.py' in general_linter.supported_extensions
-    result = general_linter.lint(simple_correct_py_func_def)
-    assert result == linter.lint(simple_correct_py_func_def)
+    assert '.py' in default_linter.supported_extensions
+    result = default_linter.lint(simple_correct_py_func_def)
+    assert result == python_linter.lint(simple_correct_py_func_def)
 
     # Test flake_lint
     assert result == flake_lint(simple_correct_py_func_def)
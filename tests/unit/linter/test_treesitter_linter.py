@@ -1,10 +1,8 @@
-from hanzo_aci.linter import DefaultLinter, LintResult
-from hanzo_aci.linter.impl.treesitter import TreesitterBasicLinter
+from hanzo_aci.linter import LintResult
 
 
-def test_syntax_error_py_file(syntax_error_py_file):
-    linter = TreesitterBasicLinter()
-    result = linter.lint(syntax_error_py_file)
+def test_syntax_error_py_file(syntax_error_py_file, treesitter_linter, default_linter):
+    result = treesitter_linter.lint(syntax_error_py_file)
     print(result)
     assert isinstance(result, list) and len(result) == 1
     assert result[0] == LintResult(
@@ -27,27 +25,27 @@ def test_syntax_error_py_file(syntax_error_py_file):
     )
     print(result[0].visualize())
 
-    general_linter = DefaultLinter()
-    general_result = general_linter.lint(syntax_error_py_file)
+    general_result = default_linter.lint(syntax_error_py_file)
     # NOTE: general linter returns different result
     # because it uses flake8 first, which is different from treesitter
     assert general_result != result
 
 
-def test_simple_correct_ruby_file(simple_correct_ruby_file):
-    linter = TreesitterBasicLinter()
-    result = linter.lint(simple_correct_ruby_file)
+def test_simple_correct_ruby_file(
+    simple_correct_ruby_file, treesitter_linter, default_linter
+):
+    result = treesitter_linter.lint(simple_correct_ruby_file)
     assert isinstance(result, list) and len(result) == 0
 
     # Test that the general linter also returns the same result
-    general_linter = DefaultLinter()
-    general_result = general_linter.lint(simple_correct_ruby_file)
+    general_result = default_linter.lint(simple_correct_ruby_file)
     assert general_result == result
 
 
-def test_simple_incorrect_ruby_file(simple_incorrect_ruby_file):
-    linter = TreesitterBasicLinter()
-    result = linter.lint(simple_incorrect_ruby_file)
+def test_simple_incorrect_ruby_file(
+    simple_incorrect_ruby_file, treesitter_linter, default_linter
+):
+    result = treesitter_linter.lint(simple_incorrect_ruby_file)
     print(result)
     assert isinstance(result, list) and len(result) == 2
     assert result[0] == LintResult(
@@ -84,14 +82,14 @@ def test_simple_incorrect_ruby_file(simple_incorrect_ruby_file):
     )
 
     # Test that the general linter also returns the same result
-    general_linter = DefaultLinter()
-    general_result = general_linter.lint(simple_incorrect_ruby_file)
+    general_result = default_linter.lint(simple_incorrect_ruby_file)
     assert general_result == result
 
 
-def test_parenthesis_incorrect_ruby_file(parenthesis_incorrect_ruby_file):
-    linter = TreesitterBasicLinter()
-    result = linter.lint(parenthesis_incorrect_ruby_file)
+def test_parenthesis_incorrect_ruby_file(
+    parenthesis_incorrect_ruby_file, treesitter_linter, default_linter
+):
+    result = treesitter_linter.lint(parenthesis_incorrect_ruby_file)
     print(result)
     assert isinstance(result, list) and len(result) == 1
     assert result[0] == LintResult(
@@ -108,6 +106,5 @@ def test_parenthesis_incorrect_ruby_file(parenthesis_incorrect_ruby_file):
     )
 
     # Test that the general linter also returns the same result
-    general_linter = DefaultLinter()
-    general_result = general_linter.lint(parenthesis_incorrect_ruby_file)
+    general_result = default_linter.lint(parenthesis_incorrect_ruby_file)
     assert general_result == result
@@ -1,45 +1,49 @@
+import os
+import stat
 from pathlib import Path
 
 import pytest
-from binaryornot.check import is_binary
 
 from hanzo_aci.editor.editor import OHEditor
 from hanzo_aci.editor.exceptions import FileValidationError
 
 
-def test_validate_large_file(tmp_path):
+@pytest.fixture(scope='module')
+def editor():
+    # validate_file keeps no state between calls, so the module can share one editor;
+    # runs with --forked still build one per test
+    return OHEditor()
+
+
+def test_validate_large_file(editor, monkeypatch):
     """Test that large files are rejected."""
-    editor = OHEditor()
-    large_file = tmp_path / 'large.txt'
+    large_file = Path('/workspace/large.txt')
 
-    # Create a file just over 10MB
+    # Validation only looks at the stat result, so no file needs to exist
     file_size = 10 * 1024 * 1024 + 1024  # 10MB + 1KB
-    with open(large_file, 'wb') as f:
-        f.write(b'0' * file_size)
+    large_stat = os.stat_result(
+        (stat.S_IFREG | 0o644, 0, 0, 1, 0, 0, file_size, 0, 0, 0)
+    )
+    monkeypatch.setattr(Path, 'stat', lambda self, **kwargs: large_stat)
 
-    with pytest.raises(FileValidationError) as exc_info:
+    with pytest.raises(FileValidationError, match=r'File is too large \(10\.0MB\)'):
         editor.validate_file(large_file)
-    assert 'File is too large' in str(exc_info.value)
-    assert '10.0MB' in str(exc_info.value)
 
 
-def test_validate_binary_file(tmp_path):
+def test_validate_binary_file(editor, tmp_path):
     """Test that binary files are rejected."""
-    editor = OHEditor()
     binary_file = tmp_path / 'binary.bin'
 
     # Create a binary file with null bytes
     with open(binary_file, 'wb') as f:
         f.write(b'Some text\x00with binary\x00content')
 
-    with pytest.raises(FileValidationError) as exc_info:
+    with pytest.raises(FileValidationError, match=r'(?i)file appears to be binary'):
         editor.validate_file(binary_file)
-    assert 'file appears to be binary' in str(exc_info.value).lower()
 
 
-def test_validate_text_file(tmp_path):
+def test_validate_text_file(editor, tmp_path):
     """Test that valid text files are accepted."""
-    editor = OHEditor()
     text_file = tmp_path / 'valid.txt'
 
     # Create a valid text file
@@ -50,48 +54,85 @@ def test_validate_text_file(tmp_path):
     editor.validate_file(text_file)
 
 
-def test_validate_directory():
+def test_validate_utf16_file(editor, tmp_path):
+    """Test that UTF-16 text with a byte order mark is not mistaken for binary."""
+    text_file = tmp_path / 'utf16.txt'
+    text_file.write_bytes('hello\nworld\n'.encode('utf-16'))
+
+    # Should not raise any exception
+    editor.validate_file(text_file)
+
+
+def test_validate_file_rechecks_modified_file(editor, tmp_path):
+    """Test that a file is sniffed again after it changes on disk."""
+    text_file = tmp_path / 'changing.txt'
+    text_file.write_text('plain text\n')
+    editor.validate_file(text_file)
+
+    text_file.write_bytes(b'Some text\x00with binary\x00content')
+    with pytest.raises(FileValidationError):
+        editor.validate_file(text_file)
+
+
+def test_validate_file_rechecks_same_size_rewrite(editor, tmp_path):
+    """Test that a rewrite keeping the size and mtime is sniffed again."""
+    text_file = tmp_path / 'rewritten.txt'
+    text_file.write_bytes(b'plain text')
+    editor.validate_file(text_file)
+    before = text_file.stat()
+
+    text_file.write_bytes(b'plain\x00tex')
+    os.utime(text_file, ns=(before.st_atime_ns, before.st_mtime_ns))
+    with pytest.raises(FileValidationError):
+        editor.validate_file(text_file)
+
+
+def test_validate_file_rechecks_replaced_file(editor, tmp_path):
+    """Test that a file replaced by an atomic rename is sniffed again."""
+    text_file = tmp_path / 'replaced.txt'
+    text_file.write_bytes(b'plain text')
+    editor.validate_file(text_file)
+    before = text_file.stat()
+
+    replacement = tmp_path / 'replacement.txt'
+    replacement.write_bytes(b'plain\x00tex')
+    os.utime(replacement, ns=(before.st_atime_ns, before.st_mtime_ns))
+    os.replace(replacement, text_file)
+    with pytest.raises(FileValidationError):
+        editor.validate_file(text_file)
+
+
+def test_validate_directory(editor):
     """Test that directories are skipped in validation."""
-    editor = OHEditor()
     # Should not raise any exception for directories
     editor.validate_file(Path('/tmp'))
 
 
-def test_validate_nonexistent_file():
+def test_validate_nonexistent_file(editor):
     """Test validation of nonexistent file."""
-    editor = OHEditor()
     nonexistent = Path('/nonexistent/file.txt')
     # Should not raise FileValidationError since validate_path will handle this case
     editor.validate_file(nonexistent)
 
 
-def test_validate_pdf_file():
+def test_validate_pdf_file(editor):
     """Test that PDF files are detected as binary."""
-    editor = OHEditor()
 
     # Get the current directory and construct path to the PDF file
     current_dir = Path(__file__).parent
     pdf_file = current_dir / 'data' / 'sample.pdf'
 
-    # the is_binary function is not accurate for PDF files
-    assert not is_binary(str(pdf_file))
-
     # PDF is a supported file type, so no exception should be raised
     editor.validate_file(pdf_file)
 
 
-def test_validate_image_file():
+def test_validate_image_file(editor):
     """Test that image files are detected as binary."""
-    editor = OHEditor()
 
     # Get the current directory and construct path to the image file
     current_dir = Path(__file__).parent.parent
     image_file = current_dir / 'data' / 'oh-logo.png'
 
-    assert is_binary(str(image_file))
-
     # Images are not supported and should be detected as binary
-    with pytest.raises(FileValidationError) as exc_info:
+    with pytest.raises(FileValidationError, match=r'(?i)file appears to be binary'):
         editor.validate_file(image_file)
-
-    assert 'file appears to be binary' in str(exc_info.value).lower()
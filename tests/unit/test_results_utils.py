@@ -1,6 +1,8 @@
+import weakref
+
 from hanzo_aci.editor.config import MAX_RESPONSE_LEN_CHAR
 from hanzo_aci.editor.prompts import CONTENT_TRUNCATED_NOTICE
-from hanzo_aci.editor.results import ToolResult, maybe_truncate
+from hanzo_aci.editor.results import CLIResult, ToolResult, maybe_truncate
 
 
 def test_tool_result_bool():
@@ -22,6 +24,30 @@ def test_tool_result_bool():
     assert bool(result)
 
 
+def test_cli_result_to_dict():
+    """Test that to_dict includes every field plus any extra fields."""
+    result = CLIResult(output='Some output', path='/tmp/file.txt', new_content='new')
+    assert result.to_dict(extra_field={'extra': 1}) == {
+        'output': 'Some output',
+        'error': None,
+        'path': '/tmp/file.txt',
+        'prev_exist': True,
+        'old_content': None,
+        'new_content': 'new',
+        'extra': 1,
+    }
+
+
+def test_cli_result_accepts_extra_attributes_and_weakrefs():
+    """Test that callers can attach attributes to results and weakly reference them."""
+    result = CLIResult(output='Some output')
+    result.extra = 'value'
+
+    assert result.extra == 'value'
+    assert weakref.ref(result)() is result
+    assert result.to_dict()['output'] == 'Some output'
+
+
 def test_maybe_truncate_no_truncation():
     """Test maybe_truncate when content does not exceed the length limit."""
     content = 'Short content'
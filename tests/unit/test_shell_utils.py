@@ -1,5 +1,6 @@
 import subprocess
-from unittest.mock import MagicMock, patch
+import sys
+import time
 
 import pytest
 
@@ -18,33 +19,98 @@ def test_run_shell_cmd_success():
     assert stderr == ''
 
 
-@patch('subprocess.Popen')
-def test_run_shell_cmd_timeout(mock_popen):
+def test_run_shell_cmd_argv():
+    """Test running a command given as an argument list, without a shell."""
+    returncode, stdout, stderr = run_shell_cmd(['echo', "it's $HOME"])
+
+    assert returncode == 0
+    assert stdout.strip() == "it's $HOME"
+    assert stderr == ''
+
+
+def test_run_shell_cmd_timeout():
     """Test that a TimeoutError is raised if command times out."""
-    mock_process = MagicMock()
-    mock_process.communicate.side_effect = subprocess.TimeoutExpired(
-        cmd='sleep 2', timeout=1
+    with pytest.raises(TimeoutError, match="Command 'sleep 2' timed out"):
+        run_shell_cmd('sleep 2', timeout=0.5)
+
+
+def test_run_shell_cmd_timeout_with_background_child():
+    """Test that a backgrounded child holding the pipes cannot outlast the timeout."""
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        run_shell_cmd('sleep 20 & echo hi', timeout=1)
+
+    assert time.monotonic() - start < 10
+
+
+def _is_running(pid: int) -> bool:
+    """Return whether a process exists and is not a zombie."""
+    state = subprocess.run(
+        ['ps', '-o', 'stat=', '-p', str(pid)], stdout=subprocess.PIPE, text=True
+    ).stdout.strip()
+    return bool(state) and not state.startswith('Z')
+
+
+@pytest.mark.skipif(sys.platform == 'win32', reason='uses a POSIX shell')
+def test_run_shell_cmd_timeout_kills_descendants(tmp_path):
+    """Test that a timeout kills the command's children, not only the shell."""
+    pidfile = tmp_path / 'pid'
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        run_shell_cmd(f'sleep 30 & echo $! > {pidfile}; wait', timeout=0.5)
+    assert time.monotonic() - start < 10
+
+    pid = int(pidfile.read_text())
+    deadline = time.monotonic() + 5
+    while _is_running(pid) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert not _is_running(pid)
+
+
+def test_run_shell_cmd_invalid_utf8():
+    """Test that undecodable bytes are replaced rather than dropping the output."""
+    returncode, stdout, _ = run_shell_cmd("printf 'ok\\n\\377'")
+
+    assert returncode == 0
+    assert stdout == 'ok\n\ufffd'
+
+
+def test_run_shell_cmd_invalid_utf8_drains_output_past_limit():
+    """Test that undecodable bytes do not stop the pipe from being drained."""
+    returncode, stdout, _ = run_shell_cmd(
+        "printf '\\377'; head -c 1000000 /dev/zero | tr '\\0' a",
+        timeout=10,
+        truncate_after=10,
     )
-    mock_popen.return_value = mock_process
 
-    with pytest.raises(TimeoutError, match="Command 'sleep 2' timed out"):
-        run_shell_cmd('sleep 2', timeout=1)
+    assert returncode == 0
+    assert stdout == '\ufffd' + 'a' * 9 + CONTENT_TRUNCATED_NOTICE
 
 
-@patch('subprocess.Popen')
-def test_run_shell_cmd_truncation(mock_popen):
+def test_run_shell_cmd_truncation():
     """Test that stdout and stderr are truncated correctly."""
-    long_output = 'a' * (MAX_RESPONSE_LEN_CHAR + 10)
-    mock_process = MagicMock()
-    mock_process.communicate.return_value = (long_output, long_output)
-    mock_process.returncode = 0
-    mock_popen.return_value = mock_process
+    size = MAX_RESPONSE_LEN_CHAR + 10
+    returncode, stdout, stderr = run_shell_cmd(
+        [
+            sys.executable,
+            '-c',
+            f"import sys; print('a' * {size}); print('b' * {size}, file=sys.stderr)",
+        ]
+    )
+
+    assert returncode == 0
+    assert stdout == 'a' * MAX_RESPONSE_LEN_CHAR + CONTENT_TRUNCATED_NOTICE
+    assert stderr == 'b' * MAX_RESPONSE_LEN_CHAR + CONTENT_TRUNCATED_NOTICE
+
 
-    returncode, stdout, stderr = run_shell_cmd('echo long_output')
+def test_run_shell_cmd_drains_output_past_limit():
+    """Test that output beyond the limit is drained so the command can finish."""
+    returncode, stdout, _ = run_shell_cmd(
+        [sys.executable, '-c', "print('a' * 1_000_000)"], truncate_after=10
+    )
 
     assert returncode == 0
-    assert len(stdout) <= MAX_RESPONSE_LEN_CHAR + len(CONTENT_TRUNCATED_NOTICE)
-    assert len(stderr) <= MAX_RESPONSE_LEN_CHAR + len(CONTENT_TRUNCATED_NOTICE)
+    assert stdout == 'a' * 10 + CONTENT_TRUNCATED_NOTICE
 
 
 def test_check_tool_installed_whoami():